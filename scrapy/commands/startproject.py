@@ -6,12 +6,12 @@ from importlib.util import find_spec
 from pathlib import Path
 from shutil import copy2, copystat, ignore_patterns, move
 from stat import S_IWUSR as OWNER_WRITE_PERMISSION
-from typing import List, Tuple, Union
+from typing import List, Set, Tuple, Union
 
 import scrapy
 from scrapy.commands import ScrapyCommand
 from scrapy.exceptions import UsageError
-from scrapy.utils.template import render_templatefile, string_camelcase
+from scrapy.utils.template import string_camelcase
 
 TEMPLATES_TO_RENDER: Tuple[Tuple[str, ...], ...] = (
     ("scrapy.cfg",),
@@ -55,12 +55,22 @@ class Command(ScrapyCommand):
             return True
         return False
 
-    def _copytree(self, src: Path, dst: Path) -> None:
+    def _copytree(
+        self,
+        src: Path,
+        dst: Path,
+        templates: Set[Path],
+        **template_vars: str,
+    ) -> None:
         """
         Since the original function always creates the directory, to resolve
         the issue a new function had to be created. It's a simple copy and
         was reduced for this case.
 
+        Files whose destination path is in ``templates`` are rendered with
+        ``template_vars`` while being copied, instead of being copied first
+        and then read and rewritten in place.
+
         More info at:
         https://github.com/scrapy/scrapy/pull/2005
         """
@@ -78,7 +88,16 @@ class Command(ScrapyCommand):
             srcname = src / name
             dstname = dst / name
             if srcname.is_dir():
-                self._copytree(srcname, dstname)
+                self._copytree(srcname, dstname, templates, **template_vars)
+            elif dstname in templates:
+                raw = srcname.read_text("utf8")
+                if dstname.suffix == ".tmpl":
+                    dstname = dstname.with_suffix("")
+                dstname.write_text(
+                    string.Template(raw).substitute(**template_vars), "utf8"
+                )
+                copystat(srcname, dstname)
+                _make_writable(dstname)
             else:
                 copy2(srcname, dstname)
                 _make_writable(dstname)
@@ -106,23 +125,25 @@ class Command(ScrapyCommand):
             self.exitcode = 1
             return
 
-        self._copytree(Path(self.templates_dir), project_dir.resolve())
+        # Template paths as found in the template directory, before the
+        # "module" directory is renamed after the project.
+        templates = {
+            Path(
+                project_dir.resolve(),
+                *(string.Template(s).substitute(project_name="module") for s in paths),
+            )
+            for paths in TEMPLATES_TO_RENDER
+        }
+        self._copytree(
+            Path(self.templates_dir),
+            project_dir.resolve(),
+            templates,
+            project_name=project_name,
+            ProjectName=string_camelcase(project_name),
+        )
         # On 3.8 shutil.move doesn't fully support Path args, but it supports our use case
         # See https://bugs.python.org/issue32689
         move(project_dir / "module", project_dir / project_name)  # type: ignore[arg-type]
-        for paths in TEMPLATES_TO_RENDER:
-            tplfile = Path(
-                project_dir,
-                *(
-                    string.Template(s).substitute(project_name=project_name)
-                    for s in paths
-                ),
-            )
-            render_templatefile(
-                tplfile,
-                project_name=project_name,
-                ProjectName=string_camelcase(project_name),
-            )
         print(
             f"New Scrapy project '{project_name}', using template directory "
             f"'{self.templates_dir}', created in:"
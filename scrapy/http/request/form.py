@@ -99,11 +99,15 @@ def _get_form_url(form: FormElement, url: Optional[str]) -> str:
 
 
 def _urlencode(seq: Iterable[FormdataKVType], enc: str) -> str:
-    values = [
-        (to_bytes(k, enc), to_bytes(v, enc))
-        for k, vs in seq
-        for v in (cast(Iterable[str], vs) if is_listlike(vs) else [cast(str, vs)])
-    ]
+    values: List[Tuple[bytes, bytes]] = []
+    for k, vs in seq:
+        k_bytes = to_bytes(k, enc)
+        if isinstance(vs, (str, bytes)):  # most common case: a single value
+            values.append((k_bytes, to_bytes(vs, enc)))
+        elif is_listlike(vs):
+            values.extend((k_bytes, to_bytes(v, enc)) for v in vs)
+        else:
+            values.append((k_bytes, to_bytes(cast(str, vs), enc)))
     return urlencode(values, doseq=True)
 
 
@@ -183,7 +187,7 @@ def _get_inputs(
 
     if not dont_click:
         clickable = _get_clickable(clickdata, form)
-        if clickable and clickable[0] not in formdata and not clickable[0] is None:
+        if clickable and clickable[0] not in formdata_keys and not clickable[0] is None:
             values.append(clickable)
 
     if isinstance(formdata, dict):
@@ -103,11 +103,36 @@ class Item(MutableMapping, object_ref, metaclass=ItemMeta):
     def __iter__(self):
         return iter(self._values)
 
+    def _reads_values(self):
+        # The shortcuts below read ``_values`` directly, which is only
+        # equivalent to going through ``__getitem__`` when it is not overridden.
+        return type(self).__getitem__ is Item.__getitem__
+
+    def __contains__(self, key):
+        if self._reads_values():
+            return key in self._values
+        return super().__contains__(key)
+
     __hash__ = object_ref.__hash__
 
+    def get(self, key, default=None):
+        if self._reads_values():
+            return self._values.get(key, default)
+        return super().get(key, default)
+
     def keys(self):
         return self._values.keys()
 
+    def items(self):
+        if self._reads_values():
+            return self._values.items()
+        return super().items()
+
+    def values(self):
+        if self._reads_values():
+            return self._values.values()
+        return super().values()
+
     def __repr__(self):
         return pformat(dict(self))
 
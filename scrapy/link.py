@@ -40,8 +40,10 @@ class Link:
         self.nofollow: bool = nofollow
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Link):
-            raise NotImplementedError
+            return NotImplemented
         return (
             self.url == other.url
             and self.text == other.text
@@ -50,9 +52,10 @@ class Link:
         )
 
     def __hash__(self) -> int:
-        return (
-            hash(self.url) ^ hash(self.text) ^ hash(self.fragment) ^ hash(self.nofollow)
-        )
+        # Attributes may be changed after creation (e.g. URL canonicalization
+        # in link extractors), so the hash cannot be computed upfront. Hashing
+        # a tuple is done in C and str objects already cache their own hash.
+        return hash((self.url, self.text, self.fragment, self.nofollow))
 
     def __repr__(self) -> str:
         return (
@@ -10,14 +10,15 @@ import hashlib
 import logging
 import mimetypes
 import time
-from collections import defaultdict
 from contextlib import suppress
+from email.utils import formatdate
 from ftplib import FTP
 from io import BytesIO
 from os import PathLike
 from pathlib import Path
-from typing import IO, DefaultDict, Optional, Set, Union
+from typing import IO, Optional, Set, Tuple, Union
 from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
 
 from itemadapter import ItemAdapter
 from twisted.internet import defer, threads
@@ -41,6 +42,38 @@ def _to_string(path: Union[str, PathLike]) -> str:
     return str(path)  # convert a Path object to string
 
 
+# Large reads keep the checksum bound by disk throughput rather than by the
+# number of read() calls.
+_MD5_CHUNK_SIZE = 128 * 1024
+
+
+# Only short URLs are cached, since the cache keeps the URLs alive and media
+# URLs may be huge data: URIs. This bounds the cache to about 10 MiB.
+_URL_SHA1_CACHE_SIZE = 4096
+_URL_SHA1_CACHE_MAX_URL_LENGTH = 2048
+
+
+def _url_sha1(url: str) -> str:
+    """Return the SHA1 hex digest of the given URL, used to name stored files.
+
+    The same URLs are hashed over and over (file and thumbnail paths, stat
+    and download of the same file, URLs shared by several items), hence the
+    cache for URLs of usual lengths.
+    """
+    if len(url) > _URL_SHA1_CACHE_MAX_URL_LENGTH:
+        return _sha1_hexdigest(url)
+    return _cached_url_sha1(url)
+
+
+@functools.lru_cache(maxsize=_URL_SHA1_CACHE_SIZE)
+def _cached_url_sha1(url: str) -> str:
+    return _sha1_hexdigest(url)
+
+
+def _sha1_hexdigest(url: str) -> str:
+    return hashlib.sha1(to_bytes(url)).hexdigest()  # nosec
+
+
 def _md5sum(file: IO) -> str:
     """Calculate the md5 checksum of a file-like object without reading its
     whole content in memory.
@@ -51,7 +84,7 @@ def _md5sum(file: IO) -> str:
     """
     m = hashlib.md5()  # nosec
     while True:
-        d = file.read(8096)
+        d = file.read(_MD5_CHUNK_SIZE)
         if not d:
             break
         m.update(d)
@@ -68,17 +101,22 @@ class FSFilesStore:
         if "://" in basedir:
             basedir = basedir.split("://", 1)[1]
         self.basedir = basedir
+        self._created_directories: Set[str] = set()
         self._mkdir(Path(self.basedir))
-        self.created_directories: DefaultDict[str, Set[str]] = defaultdict(set)
 
     def persist_file(
         self, path: Union[str, PathLike], buf, info, meta=None, headers=None
     ):
         absolute_path = self._get_filesystem_path(path)
-        self._mkdir(absolute_path.parent, info)
+        self._mkdir(absolute_path.parent)
         absolute_path.write_bytes(buf.getvalue())
 
     def stat_file(self, path: Union[str, PathLike], info):
+        # Checksumming large files would block the reactor, so read them in
+        # a thread like the other stores do for their network calls.
+        return threads.deferToThread(self._stat_file, path)
+
+    def _stat_file(self, path: Union[str, PathLike]):
         absolute_path = self._get_filesystem_path(path)
         try:
             last_modified = absolute_path.stat().st_mtime
@@ -95,11 +133,15 @@ class FSFilesStore:
         return Path(self.basedir, *path_comps)
 
     def _mkdir(self, dirname: Path, domain: Optional[str] = None):
-        seen = self.created_directories[domain] if domain else set()
-        if str(dirname) not in seen:
-            if not dirname.exists():
-                dirname.mkdir(parents=True)
-            seen.add(str(dirname))
+        # The set of directories is bounded by the store layout (e.g. full/
+        # and thumbs/<id>/), not by the number of files or spiders. domain is
+        # ignored, it is only accepted for backward compatibility. Directories
+        # removed by something else after being created here are not created
+        # again.
+        path = str(dirname)
+        if path not in self._created_directories:
+            dirname.mkdir(parents=True, exist_ok=True)
+            self._created_directories.add(path)
 
 
 class S3FilesStore:
@@ -381,6 +423,11 @@ class FilesPipeline(MediaPipeline):
         self.files_result_field = settings.get(
             resolve("FILES_RESULT_FIELD"), self.FILES_RESULT_FIELD
         )
+        # Stored paths and checksums of expired files for which a conditional
+        # request is sent.
+        self._expired_checksums: (
+            "WeakKeyDictionary[Request, Tuple[str, Optional[str]]]"
+        ) = WeakKeyDictionary()
 
         super().__init__(download_func=download_func, settings=settings)
 
@@ -428,6 +475,15 @@ class FilesPipeline(MediaPipeline):
             age_seconds = time.time() - last_modified
             age_days = age_seconds / 60 / 60 / 24
             if age_days > self.expires:
+                # Only have the file sent again if it changed since it was
+                # stored, see media_downloaded() for the 304 response handling
+                request.headers.setdefault(
+                    "If-Modified-Since", formatdate(last_modified, usegmt=True)
+                )
+                self._expired_checksums[request] = (
+                    path,
+                    result.get("checksum", None),
+                )
                 return  # returning None force download
 
             referer = referer_str(request)
@@ -479,6 +535,24 @@ class FilesPipeline(MediaPipeline):
     def media_downloaded(self, response, request, info, *, item=None):
         referer = referer_str(request)
 
+        if response.status == 304 and request in self._expired_checksums:
+            logger.debug(
+                "File (uptodate): Not modified %(medianame)s from %(request)s "
+                "referred in <%(referer)s>",
+                {"medianame": self.MEDIA_NAME, "request": request, "referer": referer},
+                extra={"spider": info.spider},
+            )
+            self.inc_stats(info.spider, "uptodate")
+            # Report the stored file that was checked, not a path computed
+            # from the 304 response, which has no body or Content-Type.
+            path, checksum = self._expired_checksums.pop(request)
+            return {
+                "url": request.url,
+                "path": path,
+                "checksum": checksum,
+                "status": "uptodate",
+            }
+
         if response.status != 200:
             logger.warning(
                 "File (code: %(status)s): Error downloading file from "
@@ -547,8 +621,7 @@ class FilesPipeline(MediaPipeline):
     def file_downloaded(self, response, request, info, *, item=None):
         path = self.file_path(request, response=response, info=info, item=item)
         buf = BytesIO(response.body)
-        checksum = _md5sum(buf)
-        buf.seek(0)
+        checksum = hashlib.md5(response.body).hexdigest()  # nosec
         self.store.persist_file(path, buf, info)
         return checksum
 
@@ -558,7 +631,7 @@ class FilesPipeline(MediaPipeline):
         return item
 
     def file_path(self, request, response=None, info=None, *, item=None):
-        media_guid = hashlib.sha1(to_bytes(request.url)).hexdigest()  # nosec
+        media_guid = _url_sha1(request.url)
         media_ext = Path(request.url).suffix
         # Handles empty and wild extensions by trying to guess the
         # mime type then extension or default to empty string otherwise
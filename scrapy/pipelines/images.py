@@ -17,11 +17,11 @@ from itemadapter import ItemAdapter
 from scrapy.exceptions import DropItem, NotConfigured, ScrapyDeprecationWarning
 from scrapy.http import Request
 from scrapy.http.request import NO_CALLBACK
-from scrapy.pipelines.files import FileException, FilesPipeline, _md5sum
+from scrapy.pipelines.files import FileException, FilesPipeline, _url_sha1
 
 # TODO: from scrapy.pipelines.media import MediaPipeline
 from scrapy.settings import Settings
-from scrapy.utils.python import get_func_args, to_bytes
+from scrapy.utils.python import get_func_args
 
 
 class NoimagesDrop(DropItem):
@@ -63,7 +63,7 @@ class ImagesPipeline(FilesPipeline):
             self._Image = Image
         except ImportError:
             raise NotConfigured(
-                "ImagesPipeline requires installing Pillow 4.0.0 or later"
+                "ImagesPipeline requires installing Pillow 7.1.0 or later"
             )
 
         super().__init__(store_uri, settings=settings, download_func=download_func)
@@ -126,8 +126,7 @@ class ImagesPipeline(FilesPipeline):
         checksum = None
         for path, image, buf in self.get_images(response, request, info, item=item):
             if checksum is None:
-                buf.seek(0)
-                checksum = _md5sum(buf)
+                checksum = hashlib.md5(buf.getvalue()).hexdigest()  # nosec
             width, height = image.size
             self.store.persist_file(
                 path,
@@ -169,6 +168,7 @@ class ImagesPipeline(FilesPipeline):
             )
         yield path, image, buf
 
+        thumb_source = None
         for thumb_id, size in self.thumbs.items():
             thumb_path = self.thumb_path(
                 request, thumb_id, response=response, info=info, item=item
@@ -176,9 +176,29 @@ class ImagesPipeline(FilesPipeline):
             if self._deprecated_convert_image:
                 thumb_image, thumb_buf = self.convert_image(image, size)
             else:
-                thumb_image, thumb_buf = self.convert_image(image, size, buf)
+                if thumb_source is None:
+                    thumb_source = self._get_thumb_source(response, orig_image, image)
+                thumb_image, thumb_buf = self.convert_image(thumb_source, size, buf)
             yield thumb_path, thumb_image, thumb_buf
 
+    def _get_thumb_source(self, response, orig_image, image):
+        """Return the image all thumbnails are resized from.
+
+        It is decoded at most once and shared by every thumbnail.
+        """
+        if orig_image.format != "JPEG":
+            return image
+        # Let libjpeg decode directly at a reduced scale (shrink-on-load)
+        # instead of decoding the full image and scaling it down afterwards.
+        # Like Image.thumbnail(), keep twice the size of the largest thumbnail
+        # so that the final resampling step still has enough pixels to work
+        # with.
+        width = max(size[0] for size in self.thumbs.values())
+        height = max(size[1] for size in self.thumbs.values())
+        thumb_source = self._Image.open(BytesIO(response.body))
+        thumb_source.draft(None, (width * 2, height * 2))
+        return thumb_source
+
     def convert_image(self, image, size=None, response_body=None):
         if response_body is None:
             warnings.warn(
@@ -188,6 +208,7 @@ class ImagesPipeline(FilesPipeline):
                 stacklevel=2,
             )
 
+        source_image = image
         if image.format in ("PNG", "WEBP") and image.mode == "RGBA":
             background = self._Image.new("RGBA", image.size, (255, 255, 255))
             background.paste(image, image)
@@ -201,7 +222,10 @@ class ImagesPipeline(FilesPipeline):
             image = image.convert("RGB")
 
         if size:
-            image = image.copy()
+            # Image.thumbnail() works in place: copy the image unless a mode
+            # conversion above already produced a new one.
+            if image is source_image:
+                image = image.copy()
             try:
                 # Image.Resampling.LANCZOS was added in Pillow 9.1.0
                 # remove this try except block,
@@ -227,9 +251,9 @@ class ImagesPipeline(FilesPipeline):
         return item
 
     def file_path(self, request, response=None, info=None, *, item=None):
-        image_guid = hashlib.sha1(to_bytes(request.url)).hexdigest()  # nosec
+        image_guid = _url_sha1(request.url)
         return f"full/{image_guid}.jpg"
 
     def thumb_path(self, request, thumb_id, response=None, info=None, *, item=None):
-        thumb_guid = hashlib.sha1(to_bytes(request.url)).hexdigest()  # nosec
+        thumb_guid = _url_sha1(request.url)
         return f"thumbs/{thumb_id}/{thumb_guid}.jpg"
@@ -1,14 +1,13 @@
 import csv
 import logging
-import re
-from io import StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
     Generator,
-    Iterable,
     List,
     Literal,
     Optional,
@@ -23,7 +22,6 @@ from lxml import etree  # nosec
 from scrapy.exceptions import ScrapyDeprecationWarning
 from scrapy.http import Response, TextResponse
 from scrapy.selector import Selector
-from scrapy.utils.python import re_rsearch, to_unicode
 
 if TYPE_CHECKING:
     from lxml._types import SupportsReadClose  # nosec
@@ -44,49 +42,19 @@ def xmliter(
     """
     warn(
         (
-            "xmliter is deprecated and its use strongly discouraged because "
-            "it is vulnerable to ReDoS attacks. Use xmliter_lxml instead. See "
+            "xmliter is deprecated and its use strongly discouraged. Its "
+            "implementation, vulnerable to ReDoS attacks, has been replaced by a "
+            "wrapper around xmliter_lxml, which raises lxml.etree.XMLSyntaxError "
+            "on malformed XML that xmliter used to accept, e.g. truncated "
+            "documents, undefined entities, content after the root element or "
+            "undeclared namespace prefixes. Use xmliter_lxml instead. See "
             "https://github.com/scrapy/scrapy/security/advisories/GHSA-cc65-xxvf-f7r9"
         ),
         ScrapyDeprecationWarning,
         stacklevel=2,
     )
 
-    nodename_patt = re.escape(nodename)
-
-    DOCUMENT_HEADER_RE = re.compile(r"<\?xml[^>]+>\s*", re.S)
-    HEADER_END_RE = re.compile(rf"<\s*/{nodename_patt}\s*>", re.S)
-    END_TAG_RE = re.compile(r"<\s*/([^\s>]+)\s*>", re.S)
-    NAMESPACE_RE = re.compile(r"((xmlns[:A-Za-z]*)=[^>\s]+)", re.S)
-    text = _body_or_str(obj)
-
-    document_header_match = re.search(DOCUMENT_HEADER_RE, text)
-    document_header = (
-        document_header_match.group().strip() if document_header_match else ""
-    )
-    header_end_idx = re_rsearch(HEADER_END_RE, text)
-    header_end = text[header_end_idx[1] :].strip() if header_end_idx else ""
-    namespaces: Dict[str, str] = {}
-    if header_end:
-        for tagname in reversed(re.findall(END_TAG_RE, header_end)):
-            assert header_end_idx
-            tag = re.search(
-                rf"<\s*{tagname}.*?xmlns[:=][^>]*>", text[: header_end_idx[1]], re.S
-            )
-            if tag:
-                for x in re.findall(NAMESPACE_RE, tag.group()):
-                    namespaces[x[1]] = x[0]
-
-    r = re.compile(rf"<{nodename_patt}[\s>].*?</{nodename_patt}>", re.DOTALL)
-    for match in r.finditer(text):
-        nodetext = (
-            document_header
-            + match.group().replace(
-                nodename, f'{nodename} {" ".join(namespaces.values())}', 1
-            )
-            + header_end
-        )
-        yield Selector(text=nodetext, type="xml")
+    yield from xmliter_lxml(obj, nodename)
 
 
 def xmliter_lxml(
@@ -104,7 +72,6 @@ def xmliter_lxml(
         resolve_entities=False,
         huge_tree=True,
     )
-    selxpath = "//" + (f"{prefix}:{nodename}" if namespace else nodename)
     needs_namespace_resolution = not namespace and ":" in nodename
     if needs_namespace_resolution:
         prefix, nodename = nodename.split(":", maxsplit=1)
@@ -117,7 +84,6 @@ def xmliter_lxml(
                     continue
                 namespace = _namespace
                 needs_namespace_resolution = False
-                selxpath = f"//{prefix}:{nodename}"
                 tag = f"{{{namespace}}}{nodename}"
             continue
         assert isinstance(data, etree._Element)
@@ -126,10 +92,20 @@ def xmliter_lxml(
             continue
         nodetext = etree.tostring(node, encoding="unicode")
         node.clear()
+        # Also drop the already processed siblings, so that memory usage does
+        # not grow with the number of nodes in the document. The root element
+        # has no parent to drop them from, and nodes nested in a node with the
+        # same tag must be kept until that node is serialized.
+        parent = node.getparent()
+        if parent is not None and next(node.iterancestors(tag), None) is None:
+            while node.getprevious() is not None:
+                del parent[0]
         xs = Selector(text=nodetext, type="xml")
         if namespace:
             xs.register_namespace(prefix, namespace)
-        yield xs.xpath(selxpath)[0]
+        # nodetext is the serialized node itself, so select the root element
+        # instead of searching the whole node for nodename.
+        yield xs.xpath("/*")[0]
 
 
 class _StreamReader:
@@ -186,14 +162,22 @@ def csviter(
     for the returned dictionaries, if not the first row is used.
 
     quotechar is the character used to enclosure fields on the given obj.
+
+    encoding is the encoding used to decode obj when it is a string of bytes
+    or a non-text Response; it defaults to utf-8.
     """
 
     encoding = obj.encoding if isinstance(obj, TextResponse) else encoding or "utf-8"
 
-    def row_to_unicode(row_: Iterable) -> List[str]:
-        return [to_unicode(field, encoding) for field in row_]
-
-    lines = StringIO(_body_or_str(obj, unicode=True))
+    lines: IO[str]
+    if isinstance(obj, (TextResponse, str)):
+        lines = StringIO(_body_or_str(obj, unicode=True))
+    else:
+        # Decode binary bodies lazily, line by line, instead of building a
+        # decoded copy of the whole body upfront.
+        lines = TextIOWrapper(
+            BytesIO(_body_or_str(obj, unicode=False)), encoding=encoding, newline="\n"
+        )
 
     kwargs: Dict[str, Any] = {}
     if delimiter:
@@ -207,10 +191,9 @@ def csviter(
             row = next(csv_r)
         except StopIteration:
             return
-        headers = row_to_unicode(row)
+        headers = row
 
     for row in csv_r:
-        row = row_to_unicode(row)
         if len(row) != len(headers):
             logger.warning(
                 "ignoring row %(csvlnum)d (length: %(csvrow)d, "
@@ -123,7 +123,7 @@ def md5sum(file: IO) -> str:
     )
     m = hashlib.md5()  # nosec
     while True:
-        d = file.read(8096)
+        d = file.read(128 * 1024)
         if not d:
             break
         m.update(d)
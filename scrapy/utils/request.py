@@ -5,12 +5,15 @@ scrapy.http.Request objects
 
 import hashlib
 import json
+import re
+import sys
 import warnings
+from functools import lru_cache, partial
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
-    Generator,
+    FrozenSet,
     Iterable,
     List,
     Optional,
@@ -35,19 +38,58 @@ if TYPE_CHECKING:
     from scrapy.crawler import Crawler
 
 
-def _serialize_headers(
-    headers: Iterable[bytes], request: Request
-) -> Generator[bytes, Any, None]:
-    for header in headers:
-        if header in request.headers:
-            yield header
-            yield from request.headers.getlist(header)
+# Fingerprints are not a security feature. Saying so to hashlib lets SHA1 be
+# used on systems where FIPS mode restricts it.
+if sys.version_info >= (3, 9):
+    _sha1 = partial(hashlib.sha1, usedforsecurity=False)
+else:
+    _sha1 = hashlib.sha1
+
+_canonical_url_cache: "WeakKeyDictionary[Request, Dict[bool, str]]"
+_canonical_url_cache = WeakKeyDictionary()
+
+
+# URLs that canonicalize_url() would return unchanged: lowercase ASCII host,
+# no port, userinfo, query or fragment, and only unreserved characters in a
+# non-empty path. Many extracted links look like this.
+_CANONICAL_URL_RE = re.compile(r"https?://[a-z0-9.\-]+/[A-Za-z0-9\-._~/]*")
+
+
+def _canonicalize_url(url: str, keep_fragments: bool) -> str:
+    if _CANONICAL_URL_RE.fullmatch(url):
+        return url
+    return canonicalize_url(url, keep_fragments=keep_fragments)
+
+
+def _canonicalize_request_url(request: Request, keep_fragments: bool) -> str:
+    # Fingerprints of the same request with different include_headers share
+    # the URL canonicalization, which is the most expensive part of them.
+    # Default fingerprints are computed only once per request, so they use
+    # _canonicalize_url() directly instead of keeping the URL around.
+    cache = _canonical_url_cache.get(request)
+    if cache is None:
+        cache = _canonical_url_cache[request] = {}
+    url = cache.get(keep_fragments)
+    if url is None:
+        url = cache[keep_fragments] = _canonicalize_url(request.url, keep_fragments)
+    return url
+
+
+@lru_cache(maxsize=128)
+def _process_include_headers(
+    include_headers: Tuple[Union[bytes, str], ...]
+) -> Tuple[bytes, ...]:
+    # Fingerprinters usually pass the same few header lists over and over,
+    # so this saves encoding, lowercasing and sorting them on every call.
+    return tuple(sorted({to_bytes(h).lower() for h in include_headers}))
 
 
 _fingerprint_cache: (
     "WeakKeyDictionary[Request, Dict[Tuple[Optional[Tuple[bytes, ...]], bool], bytes]]"
 )
 _fingerprint_cache = WeakKeyDictionary()
+_default_fingerprint_cache: "WeakKeyDictionary[Request, bytes]"
+_default_fingerprint_cache = WeakKeyDictionary()
 
 
 def fingerprint(
@@ -86,33 +128,62 @@ def fingerprint(
     If you want to include them, set the keep_fragments argument to True
     (for instance when handling requests with a headless browser).
     """
+    if not include_headers and not keep_fragments:
+        # Most requests are only ever fingerprinted with the default
+        # arguments, so those fingerprints skip the cache key handling below.
+        fp = _default_fingerprint_cache.get(request)
+        if fp is None:
+            fp = _default_fingerprint_cache[request] = _fingerprint(
+                request, _canonicalize_url(request.url, keep_fragments=False)
+            )
+        return fp
     processed_include_headers: Optional[Tuple[bytes, ...]] = None
     if include_headers:
-        processed_include_headers = tuple(
-            to_bytes(h.lower()) for h in sorted(include_headers)
-        )
-    cache = _fingerprint_cache.setdefault(request, {})
+        processed_include_headers = _process_include_headers(tuple(include_headers))
+    cache = _fingerprint_cache.get(request)
+    if cache is None:
+        cache = _fingerprint_cache[request] = {}
     cache_key = (processed_include_headers, keep_fragments)
-    if cache_key not in cache:
-        # To decode bytes reliably (JSON does not support bytes), regardless of
-        # character encoding, we use bytes.hex()
-        headers: Dict[str, List[str]] = {}
-        if processed_include_headers:
-            for header in processed_include_headers:
-                if header in request.headers:
-                    headers[header.hex()] = [
-                        header_value.hex()
-                        for header_value in request.headers.getlist(header)
-                    ]
-        fingerprint_data = {
-            "method": to_unicode(request.method),
-            "url": canonicalize_url(request.url, keep_fragments=keep_fragments),
-            "body": (request.body or b"").hex(),
-            "headers": headers,
-        }
-        fingerprint_json = json.dumps(fingerprint_data, sort_keys=True)
-        cache[cache_key] = hashlib.sha1(fingerprint_json.encode()).digest()  # nosec
-    return cache[cache_key]
+    fp = cache.get(cache_key)
+    if fp is None:
+        fp = cache[cache_key] = _fingerprint(
+            request,
+            _canonicalize_request_url(request, keep_fragments),
+            processed_include_headers,
+        )
+    return fp
+
+
+def _fingerprint(
+    request: Request,
+    canonical_url: str,
+    processed_include_headers: Optional[Tuple[bytes, ...]] = None,
+) -> bytes:
+    # The hashed data is the json.dumps(..., sort_keys=True) output of a dict
+    # with the body, headers, method and url keys. It is built by hand, since
+    # dumping and sorting the whole dict dominates the fingerprinting time,
+    # but it must stay byte-for-byte identical to keep fingerprints stable.
+    # To decode bytes reliably (JSON does not support bytes), regardless of
+    # character encoding, we use bytes.hex(), which needs no escaping.
+    # processed_include_headers must be sorted and free of duplicates.
+    headers: List[str] = []
+    if processed_include_headers:
+        request_headers = request.headers
+        for header in processed_include_headers:
+            if header in request_headers:
+                values = ", ".join(
+                    f'"{header_value.hex()}"'
+                    for header_value in request_headers.getlist(header)
+                )
+                headers.append(f'"{header.hex()}": [{values}]')
+    method = json.dumps(to_unicode(request.method))
+    url = json.dumps(canonical_url)
+    body = (request.body or b"").hex()
+    fingerprint_json = (
+        f'{{"body": "{body}", "headers": {{{", ".join(headers)}}}, '
+        f'"method": {method}, "url": {url}}}'
+    )
+    return _sha1(fingerprint_json.encode()).digest()
 
 
 class RequestFingerprinterProtocol(Protocol):
@@ -175,13 +246,18 @@ def request_httprepr(request: Request) -> bytes:
     """
     parsed = urlparse_cached(request)
     path = urlunparse(("", "", parsed.path or "/", parsed.params, parsed.query, ""))
-    s = to_bytes(request.method) + b" " + to_bytes(path) + b" HTTP/1.1\r\n"
-    s += b"Host: " + to_bytes(parsed.hostname or b"") + b"\r\n"
+    parts = [
+        to_bytes(request.method),
+        b" ",
+        to_bytes(path),
+        b" HTTP/1.1\r\nHost: ",
+        to_bytes(parsed.hostname or b""),
+        b"\r\n",
+    ]
     if request.headers:
-        s += request.headers.to_string() + b"\r\n"
-    s += b"\r\n"
-    s += request.body
-    return s
+        parts += [request.headers.to_string(), b"\r\n"]
+    parts += [b"\r\n", request.body]
+    return b"".join(parts)
 
 
 def referer_str(request: Request) -> Optional[str]:
@@ -198,8 +274,11 @@ def request_from_dict(d: dict, *, spider: Optional[Spider] = None) -> Request:
     If a spider is given, it will try to resolve the callbacks looking at the
     spider for methods with the same name.
     """
-    request_cls: Type[Request] = load_object(d["_class"]) if "_class" in d else Request
-    kwargs = {key: value for key, value in d.items() if key in request_cls.attributes}
+    request_cls: Type[Request] = (
+        _load_request_class(d["_class"]) if "_class" in d else Request
+    )
+    attributes = _request_class_attributes(request_cls)
+    kwargs = {key: value for key, value in d.items() if key in attributes}
     if d.get("callback") and spider:
         kwargs["callback"] = _get_method(spider, d["callback"])
     if d.get("errback") and spider:
@@ -207,6 +286,26 @@ def request_from_dict(d: dict, *, spider: Optional[Spider] = None) -> Request:
     return request_cls(**kwargs)
 
 
+@lru_cache(maxsize=None)
+def _load_request_class(path: str) -> Type[Request]:
+    """Helper function for request_from_dict"""
+    # Resuming a crawl deserializes many requests of only a few classes.
+    return load_object(path)
+
+
+_request_class_attributes_cache: Dict[Type[Request], FrozenSet[str]] = {}
+
+
+def _request_class_attributes(request_cls: Type[Request]) -> FrozenSet[str]:
+    """Helper function for request_from_dict"""
+    attributes = _request_class_attributes_cache.get(request_cls)
+    if attributes is None:
+        attributes = _request_class_attributes_cache[request_cls] = frozenset(
+            request_cls.attributes
+        )
+    return attributes
+
+
 def _get_method(obj: Any, name: Any) -> Any:
     """Helper function for request_from_dict"""
     name = str(name)
@@ -885,6 +885,16 @@ class FormRequestTest(RequestTest):
         fs = _qs(req)
         self.assertEqual(fs[b"clickme"], [b"two"])
 
+    def test_from_response_override_clickable_formdata_list(self):
+        response = _buildresponse(
+            """<form><input type="submit" name="clickme" value="one"> </form>"""
+        )
+        req = self.request_class.from_response(
+            response, formdata=[("clickme", "two")], clickdata={"name": "clickme"}
+        )
+        fs = _qs(req)
+        self.assertEqual(fs[b"clickme"], [b"two"])
+
     def test_from_response_dont_click(self):
         response = _buildresponse(
             """<form action="get.php" method="GET">
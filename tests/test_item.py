@@ -242,6 +242,40 @@ class ItemTest(unittest.TestCase):
         i["name"] = "John"
         self.assertEqual(dict(i), {"name": "John"})
 
+    def test_mapping_methods(self):
+        class TestItem(Item):
+            name = Field()
+            age = Field()
+
+        i = TestItem(name="John")
+        self.assertIn("name", i)
+        self.assertNotIn("age", i)
+        self.assertNotIn("other", i)
+        self.assertEqual(i.get("name"), "John")
+        self.assertIsNone(i.get("age"))
+        self.assertEqual(i.get("age", 42), 42)
+        self.assertEqual(list(i.items()), [("name", "John")])
+        self.assertEqual(list(i.values()), ["John"])
+
+    def test_mapping_methods_custom_getitem(self):
+        class TestItem(Item):
+            name = Field()
+            age = Field()
+
+            def __getitem__(self, key):
+                if key == "age" and key not in self._values:
+                    return 42
+                return super().__getitem__(key).upper()
+
+        i = TestItem(name="John")
+        self.assertIn("name", i)
+        self.assertIn("age", i)
+        self.assertNotIn("other", i)
+        self.assertEqual(i.get("name"), "JOHN")
+        self.assertEqual(i.get("age"), 42)
+        self.assertEqual(list(i.items()), [("name", "JOHN")])
+        self.assertEqual(list(i.values()), ["JOHN"])
+
     def test_copy(self):
         class TestItem(Item):
             name = Field()
@@ -45,6 +45,18 @@ class LinkTest(unittest.TestCase):
         self._assert_different_links(l7, l9)
         self._assert_different_links(l7, l10)
 
+    def test_eq_other_types(self):
+        link = Link("http://www.example.com")
+        self.assertNotEqual(link, "http://www.example.com")
+        self.assertNotIn(link, ["http://www.example.com"])
+
+    def test_hash_after_attribute_change(self):
+        l1 = Link("http://www.example.com/?b=2&a=1")
+        l2 = Link("http://www.example.com/?a=1&b=2")
+        hash(l1)
+        l1.url = l2.url
+        self._assert_same_links(l1, l2)
+
     def test_repr(self):
         l1 = Link(
             "http://www.example.com", text="test", fragment="something", nofollow=True
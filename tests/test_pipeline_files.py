@@ -3,6 +3,7 @@ import os
 import random
 import time
 from datetime import datetime
+from email.utils import formatdate
 from io import BytesIO
 from pathlib import Path
 from shutil import rmtree
@@ -120,6 +121,35 @@ class FilesPipelineTestCase(unittest.TestCase):
         fullpath = Path(self.tempdir, "some", "image", "key.jpg")
         self.assertEqual(self.pipeline.store._get_filesystem_path(path), fullpath)
 
+    def test_fs_store_creates_directories_once(self):
+        store = self.pipeline.store
+        with mock.patch.object(
+            Path, "mkdir", autospec=True, side_effect=Path.mkdir
+        ) as mkdir:
+            store.persist_file("some/dir/a.jpg", BytesIO(b"a"), info=None)
+            self.assertTrue(mkdir.called)
+            mkdir.reset_mock()
+            store.persist_file("some/dir/b.jpg", BytesIO(b"b"), info=None)
+        self.assertFalse(mkdir.called)
+        self.assertEqual(Path(self.tempdir, "some", "dir", "b.jpg").read_bytes(), b"b")
+
+    def test_fs_store_mkdir_domain(self):
+        # The domain argument is ignored, but still accepted.
+        store = self.pipeline.store
+        store._mkdir(Path(self.tempdir, "some", "dir"), "domain")
+        self.assertTrue(Path(self.tempdir, "some", "dir").is_dir())
+
+    @defer.inlineCallbacks
+    def test_fs_store_stat(self):
+        store = self.pipeline.store
+        stat = yield store.stat_file("missing.pdf", info=None)
+        self.assertEqual(stat, {})
+
+        store.persist_file("some/file.pdf", BytesIO(b"data"), info=None)
+        stat = yield store.stat_file("some/file.pdf", info=None)
+        self.assertEqual(stat["checksum"], "8d777f385d3dfec8815d20f7496026dc")
+        self.assertIn("last_modified", stat)
+
     @defer.inlineCallbacks
     def test_file_not_expired(self):
         item_url = "http://example.com/file.pdf"
@@ -178,6 +208,48 @@ class FilesPipelineTestCase(unittest.TestCase):
         for p in patchers:
             p.stop()
 
+    @defer.inlineCallbacks
+    def test_file_expired_not_modified(self):
+        item_url = "http://example.com/file4.pdf"
+        item = _create_item_with_files(item_url)
+        last_modified = time.time() - (self.pipeline.expires * 60 * 60 * 24 * 2)
+        request = Request(
+            item_url,
+            meta={"response": Response(item_url, status=304)},
+        )
+        patchers = [
+            mock.patch.object(
+                FSFilesStore,
+                "stat_file",
+                return_value={"checksum": "abc", "last_modified": last_modified},
+            ),
+            mock.patch.object(
+                FilesPipeline, "get_media_requests", return_value=[request]
+            ),
+            mock.patch.object(FilesPipeline, "inc_stats", return_value=True),
+        ]
+        for p in patchers:
+            p.start()
+
+        def file_path(request, response=None, info=None, *, item=None):
+            # e.g. an extension taken from the Content-Type of the response
+            if response is not None:
+                raise ValueError("304 responses have no Content-Type")
+            return "full/stored.pdf"
+
+        self.pipeline.file_path = file_path
+        result = yield self.pipeline.process_item(item, None)
+        self.assertEqual(
+            request.headers["If-Modified-Since"],
+            formatdate(last_modified, usegmt=True).encode(),
+        )
+        self.assertEqual(result["files"][0]["checksum"], "abc")
+        self.assertEqual(result["files"][0]["status"], "uptodate")
+        self.assertEqual(result["files"][0]["path"], "full/stored.pdf")
+
+        for p in patchers:
+            p.stop()
+
     @defer.inlineCallbacks
     def test_file_cached(self):
         item_url = "http://example.com/file3.pdf"
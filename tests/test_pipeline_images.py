@@ -15,6 +15,7 @@ from twisted.trial import unittest
 from scrapy.exceptions import ScrapyDeprecationWarning
 from scrapy.http import Request, Response
 from scrapy.item import Field, Item
+from scrapy.pipelines.files import _cached_url_sha1, _sha1_hexdigest
 from scrapy.pipelines.images import ImageException, ImagesPipeline, NoimagesDrop
 from scrapy.settings import Settings
 from scrapy.utils.python import to_bytes
@@ -118,6 +119,29 @@ class ImagesPipelineTestCase(unittest.TestCase):
             "thumbs/50/850233df65a5b83361798f532f1fc549cd13cbe9.jpg",
         )
 
+    def test_url_hashed_once(self):
+        request = Request("http://www.example.com/image.jpg")
+        _cached_url_sha1.cache_clear()
+        with patch(
+            "scrapy.pipelines.files._sha1_hexdigest", wraps=_sha1_hexdigest
+        ) as sha1:
+            file_path = self.pipeline.file_path(request)
+            thumb_path = self.pipeline.thumb_path(request, "50")
+            self.assertEqual(self.pipeline.file_path(request), file_path)
+            self.assertEqual(self.pipeline.file_path(request.copy()), file_path)
+        self.assertEqual(sha1.call_count, 1)
+        guid = hashlib.sha1(to_bytes(request.url)).hexdigest()
+        self.assertEqual(file_path, f"full/{guid}.jpg")
+        self.assertEqual(thumb_path, f"thumbs/50/{guid}.jpg")
+
+    def test_long_url_not_cached(self):
+        request = Request("data:image/png;base64," + "A" * 4096)
+        _cached_url_sha1.cache_clear()
+        file_path = self.pipeline.file_path(request)
+        self.assertEqual(_cached_url_sha1.cache_info().currsize, 0)
+        guid = hashlib.sha1(to_bytes(request.url)).hexdigest()
+        self.assertEqual(file_path, f"full/{guid}.jpg")
+
     def test_thumbnail_name_from_item(self):
         """
         Custom thumbnail name based on item data, overriding default implementation
@@ -184,6 +208,29 @@ class ImagesPipelineTestCase(unittest.TestCase):
         self.assertEqual(thumb_img, thumb_img)
         self.assertEqual(orig_thumb_buf.getvalue(), thumb_buf.getvalue())
 
+    def test_get_images_jpeg_thumbs_shrink_on_load(self):
+        self.pipeline.thumbs = {"small": (50, 50), "tiny": (20, 20)}
+
+        _, buf = _create_image("JPEG", "RGB", (800, 600), (0, 127, 255))
+        resp = Response(url="https://dev.mydeco.com/mydeco.gif", body=buf.getvalue())
+        req = Request(url="https://dev.mydeco.com/mydeco.gif")
+
+        orig_image = Image.open(io.BytesIO(resp.body))
+        thumb_source = self.pipeline._get_thumb_source(resp, orig_image, orig_image)
+        self.assertEqual(thumb_source.size, (200, 150))
+
+        with patch.object(
+            self.pipeline, "_get_thumb_source", wraps=self.pipeline._get_thumb_source
+        ) as get_thumb_source:
+            images = list(
+                self.pipeline.get_images(response=resp, request=req, info=object())
+            )
+        self.assertEqual(get_thumb_source.call_count, 1)
+        self.assertEqual(
+            [image.size for _, image, _ in images], [(800, 600), (50, 38), (20, 15)]
+        )
+        self.assertEqual([image.mode for _, image, _ in images], ["RGB"] * 3)
+
     def test_get_images_old(self):
         self.pipeline.thumbs = {"small": (20, 20)}
         orig_im, buf = _create_image("JPEG", "RGB", (50, 50), (0, 0, 0))
@@ -1,8 +1,9 @@
 import unittest
+from unittest import mock
 
 from scrapy import Request, Spider
 from scrapy.http import FormRequest, JsonRequest
-from scrapy.utils.request import request_from_dict
+from scrapy.utils.request import _load_request_class, request_from_dict
 
 
 class CustomRequest(Request):
@@ -74,6 +75,17 @@ class RequestSerializationTest(unittest.TestCase):
         r3 = JsonRequest("http://www.example.com", dumps_kwargs={"indent": 4})
         self._assert_serializes_ok(r3, spider=self.spider)
 
+    def test_request_class_loaded_once(self):
+        d = CustomRequest("http://www.example.com").to_dict()
+        _load_request_class.cache_clear()
+        with mock.patch(
+            "scrapy.utils.request.load_object", return_value=CustomRequest
+        ) as load_object:
+            request_from_dict(d)
+            request_from_dict(d)
+        _load_request_class.cache_clear()
+        load_object.assert_called_once_with(d["_class"])
+
     def test_callback_serialization(self):
         r = Request(
             "http://www.example.com",
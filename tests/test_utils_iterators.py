@@ -1,4 +1,5 @@
 import pytest
+from lxml import etree
 from twisted.trial import unittest
 
 from scrapy.exceptions import ScrapyDeprecationWarning
@@ -40,6 +41,47 @@ class XmliterBaseTestCase:
             attrs, [("001", ["Name 1"], ["Type 1"]), ("002", ["Name 2"], ["Type 2"])]
         )
 
+    @pytest.mark.filterwarnings("ignore::scrapy.exceptions.ScrapyDeprecationWarning")
+    def test_xmliter_many_nodes(self):
+        body = (
+            b'<?xml version="1.0" encoding="UTF-8"?><products>'
+            + b"".join(
+                b"<other>%d</other><product>%d</product>" % (i, i) for i in range(1000)
+            )
+            + b"</products>"
+        )
+        response = XmlResponse(url="http://example.com", body=body)
+        self.assertEqual(
+            [x.xpath("text()").get() for x in self.xmliter(response, "product")],
+            [str(i) for i in range(1000)],
+        )
+
+    @pytest.mark.filterwarnings("ignore::scrapy.exceptions.ScrapyDeprecationWarning")
+    def test_xmliter_root_node_after_prolog(self):
+        for prolog in (b"<!-- comment -->", b'<?xml-stylesheet href="s.xsl"?>'):
+            body = (
+                b'<?xml version="1.0"?>'
+                + prolog
+                + b"<products><product>1</product></products>"
+            )
+            response = XmlResponse(url="http://example.com", body=body)
+            self.assertEqual(
+                [x.get() for x in self.xmliter(response, "products")],
+                ["<products><product>1</product></products>"],
+            )
+
+    @pytest.mark.filterwarnings("ignore::scrapy.exceptions.ScrapyDeprecationWarning")
+    def test_xmliter_nested_nodes(self):
+        body = b"<r><product><a>keep</a><product>inner</product></product></r>"
+        response = XmlResponse(url="http://example.com", body=body)
+        self.assertEqual(
+            [x.get() for x in self.xmliter(response, "product")],
+            [
+                "<product>inner</product>",
+                "<product><a>keep</a><product/></product>",
+            ],
+        )
+
     @pytest.mark.filterwarnings("ignore::scrapy.exceptions.ScrapyDeprecationWarning")
     def test_xmliter_unusual_node(self):
         body = b"""<?xml version="1.0" encoding="UTF-8"?>
@@ -269,6 +311,26 @@ class XmliterTestCase(XmliterBaseTestCase, unittest.TestCase):
         ):
             next(self.xmliter(body, "product"))
 
+    @pytest.mark.filterwarnings("ignore::scrapy.exceptions.ScrapyDeprecationWarning")
+    def test_malformed_xml(self):
+        # The regex-based implementation used to tolerate these documents.
+        cases = (
+            (
+                b"<products><product>1</product><product>2</product><prod",
+                "product",
+                ["1", "2"],
+            ),
+            (b"<products><product>a&nbsp;b</product></products>", "product", []),
+            (b"<products><product>1</product></products>junk", "product", ["1"]),
+            (b"<products><g:product>1</g:product></products>", "g:product", ["1"]),
+        )
+        for body, nodename, expected in cases:
+            texts = []
+            with self.assertRaises(etree.XMLSyntaxError):
+                for node in self.xmliter(body, nodename):
+                    texts.append(node.xpath("text()").get())
+            self.assertEqual(texts, expected)
+
 
 class LxmlXmliterTestCase(XmliterBaseTestCase, unittest.TestCase):
     xmliter = staticmethod(xmliter_lxml)
@@ -450,6 +512,31 @@ class UtilsCsvTestCase(unittest.TestCase):
             ],
         )
 
+    def test_csviter_bytes(self):
+        body = get_testdata("feeds", "feed-sample3.csv")
+
+        self.assertEqual(
+            list(csviter(body)),
+            [
+                {"id": "1", "name": "alpha", "value": "foobar"},
+                {"id": "2", "name": "unicode", "value": "\xfan\xedc\xf3d\xe9\u203d"},
+                {"id": "3", "name": "multi", "value": "foo\nbar"},
+                {"id": "4", "name": "empty", "value": ""},
+            ],
+        )
+        self.assertEqual(list(csviter(body)), list(csviter(body.decode("utf-8"))))
+
+    def test_csviter_bytes_encoding(self):
+        body = get_testdata("feeds", "feed-sample4.csv")
+
+        self.assertEqual(
+            list(csviter(body, encoding="latin1")),
+            [
+                {"id": "1", "name": "latin1", "value": "test"},
+                {"id": "2", "name": "something", "value": "\xf1\xe1\xe9\xf3"},
+            ],
+        )
+
     def test_csviter_headers(self):
         sample = get_testdata("feeds", "feed-sample3.csv").splitlines()
         headers, body = sample[0].split(b","), b"\n".join(sample[1:])
@@ -3,11 +3,17 @@ import unittest
 import warnings
 from hashlib import sha1
 from typing import Dict, Optional, Tuple, Union
+from unittest import mock
 from weakref import WeakKeyDictionary
 
+from w3lib.url import canonicalize_url
+
 from scrapy.http import Request
 from scrapy.utils.python import to_bytes
 from scrapy.utils.request import (
+    _CANONICAL_URL_RE,
+    _canonical_url_cache,
+    _default_fingerprint_cache,
     _fingerprint_cache,
     fingerprint,
     request_authenticate,
@@ -60,7 +66,7 @@ class FingerprintTest(unittest.TestCase):
         "WeakKeyDictionary[Request, Dict[Tuple[Optional[Tuple[bytes, ...]], bool], bytes]]",
         "WeakKeyDictionary[Request, Dict[Tuple[Optional[Tuple[bytes, ...]], bool], str]]",
     ] = _fingerprint_cache
-    default_cache_key = (None, False)
+    default_cache: "WeakKeyDictionary[Request, bytes]" = _default_fingerprint_cache
     known_hashes: Tuple[Tuple[Request, Union[bytes, str], Dict], ...] = (
         (
             Request("http://example.org"),
@@ -127,6 +133,11 @@ class FingerprintTest(unittest.TestCase):
             b"\xc1\xef~\x94\x9bS\xc1\x83\t\xdcz8\x9f\xdc{\x11\x16I.\x11",
             {"include_headers": ["A"], "keep_fragments": True},
         ),
+        (
+            Request("https://example.org", headers={"A": b"B", "C": [b"D", b"E"]}),
+            b"\xf5\xf3U\x9e\x12h\x00\xe5W\x8e\x19KH\xddC\x8a\xd2\xe3\x9d\xb6",
+            {"include_headers": ["c", "A", "a"]},
+        ),
         (
             Request("https://example.org/ab"),
             b"N\xe5l\xb8\x12@iw\xe2\xf3\x1bp\xea\xffp!u\xe2\x8a\xc6",
@@ -152,7 +163,54 @@ class FingerprintTest(unittest.TestCase):
 
     def test_caching(self):
         r1 = Request("http://www.example.com/hnnoticiaj1.aspx?78160,199")
-        self.assertEqual(self.function(r1), self.cache[r1][self.default_cache_key])
+        self.assertEqual(self.function(r1), self.default_cache[r1])
+        self.assertEqual(
+            self.function(r1, keep_fragments=True), self.cache[r1][(None, True)]
+        )
+
+    def test_url_canonicalized_once(self):
+        r1 = Request("http://www.example.com/query?id=111&cat=222")
+        with mock.patch(
+            "scrapy.utils.request.canonicalize_url", wraps=canonicalize_url
+        ) as canonicalize:
+            self.function(r1, include_headers=["Accept-Language"])
+            self.function(r1, include_headers=["Accept-Language", "SESSIONID"])
+            self.function(r1, keep_fragments=True)
+        self.assertEqual(canonicalize.call_count, 2)
+
+    def test_default_fingerprint_does_not_cache_url(self):
+        r1 = Request("http://www.example.com/query?id=111&cat=222")
+        self.function(r1)
+        self.assertNotIn(r1, _canonical_url_cache)
+
+    def test_canonical_url_fast_path(self):
+        r1 = Request("https://www.example.com/a/b-c_d.html")
+        with mock.patch("scrapy.utils.request.canonicalize_url") as canonicalize:
+            self.function(r1)
+        canonicalize.assert_not_called()
+
+        canonical_urls = (
+            "http://www.example.com/",
+            "https://www.example.com/~user/page.html",
+            "https://www.example.com/a/b-c_d.html",
+        )
+        for url in canonical_urls:
+            self.assertTrue(_CANONICAL_URL_RE.fullmatch(url), url)
+            self.assertEqual(canonicalize_url(url), url)
+
+        other_urls = (
+            "http://www.example.com",
+            "http://www.example.com:80/",
+            "http://www.Example.com/",
+            "http://www.example.com/a b",
+            "http://www.example.com/a%2f",
+            "http://www.example.com/?b=1&a=2",
+            "http://www.example.com/#fragment",
+            "http://user@www.example.com/",
+            "ftp://www.example.com/",
+        )
+        for url in other_urls:
+            self.assertIsNone(_CANONICAL_URL_RE.fullmatch(url), url)
 
     def test_header(self):
         r1 = Request("http://www.example.com/members/offers.html")
@@ -183,6 +241,12 @@ class FingerprintTest(unittest.TestCase):
             self.function(r3, include_headers=["SESSIONID", "Accept-Language"]),
         )
 
+    def test_include_headers_cache_key(self):
+        r1 = Request("http://www.example.com/", headers={"X-ID": b"1"})
+        fp = self.function(r1, include_headers=["X-ID", "Accept"])
+        self.assertEqual(fp, self.function(r1, include_headers=["accept", "x-id"]))
+        self.assertEqual(list(self.cache[r1]), [((b"accept", b"x-id"), False)])
+
     def test_fragment(self):
         r1 = Request("http://www.example.com/test.html")
         r2 = Request("http://www.example.com/test.html#fragment")